@@ -1,9 +1,8 @@
 import pygame
 import math
-import matplotlib.pyplot as plt
-from io import BytesIO
+import functools
+import os
 import numpy as np
-from pygame import gfxdraw
 
 # ---------------------
 # Pygame Initialization
@@ -11,7 +10,10 @@ from pygame import gfxdraw
 pygame.init()
 
 WIDTH, HEIGHT = 1000, 700
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
+# SCALED + DOUBLEBUF hands final composition to SDL2's GPU-backed
+# renderer and vsync paces the frames; flip() stays the full-frame
+# present (every frame repaints 100% of the pixels anyway).
+screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
 pygame.display.set_caption("Enhanced 2D Robotic Arm Simulator")
 
 # -------------------
@@ -43,6 +45,41 @@ header_font = pygame.font.SysFont("Arial", 28, bold=True)
 font = pygame.font.SysFont("Arial", 22)       # Slightly smaller for uniformity
 small_font = pygame.font.SysFont("Arial", 18)
 
+@functools.lru_cache(maxsize=512)
+def cached_render(font_obj, text, color):
+    """
+    Memoized font.render. Labels repeat heavily frame-to-frame (angles are
+    quantized to .1f/.2f, coordinates to ints), so the cache hit rate is
+    high and glyph rasterization is skipped on hits.
+    """
+    return font_obj.render(text, True, color).convert_alpha()
+
+@functools.lru_cache(maxsize=256)
+def chrome_bg(width, height, fill, border=None, border_radius=5):
+    """
+    Memoized rounded-rect background for text labels. The label sizes are
+    bounded by the cached text surfaces, so hot frames reuse these instead
+    of allocating and rasterizing a fresh SRCALPHA surface per label.
+    """
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.rect(surface, fill, surface.get_rect(), border_radius=border_radius)
+    if border:
+        pygame.draw.rect(surface, border, surface.get_rect(), width=1, border_radius=border_radius)
+    return surface.convert_alpha()
+
+# ---------------------------
+# Deferred Blit Queue (UI)
+# ---------------------------
+# Top-layer UI surfaces (panels, labels, arcs, text) are collected here
+# during the frame and submitted in a single screen.fblits batch right
+# before flip, instead of paying per-call blit setup ~30 times a frame.
+# Blits that must sit underneath vector draws (shadows, trail, target)
+# stay immediate.
+draw_queue = []
+
+def queue_blit(surface, pos):
+    draw_queue.append((surface, pos))
+
 clock = pygame.time.Clock()
 
 # -------------------------
@@ -52,22 +89,30 @@ L1 = 150
 L2 = 150
 BASE_X, BASE_Y = WIDTH // 3, HEIGHT // 2
 
+# Derived constants for the IK hot path
+L1_SQ = L1 * L1
+L2_SQ = L2 * L2
+TWO_L1_L2 = 2 * L1 * L2
+MAX_REACH_SQ = (L1 + L2) ** 2
+
 # ------------------------------------
 # Create a Vertical Gradient Background
 # ------------------------------------
 def create_gradient_surface(width, height, start_color, end_color, vertical=True):
-    surface = pygame.Surface((width, height), pygame.SRCALPHA)
-    for i in range(height if vertical else width):
-        factor = i / (height if vertical else width)
-        current_color = [
-            int(start_color[j] + (end_color[j] - start_color[j]) * factor)
-            for j in range(3)
-        ]
-        if vertical:
-            pygame.draw.line(surface, current_color, (0, i), (width, i))
-        else:
-            pygame.draw.line(surface, current_color, (i, 0), (i, height))
-    return surface
+    # Build the full pixel ramp in one NumPy broadcast and hand it to the
+    # surface in a single bulk transfer instead of one draw.line per row.
+    steps = height if vertical else width
+    factor = (np.arange(steps) / steps).reshape(-1, 1)
+    start = np.asarray(start_color[:3], dtype=np.float64)
+    end = np.asarray(end_color[:3], dtype=np.float64)
+    ramp = (start + (end - start) * factor).astype(np.uint8)
+    if vertical:
+        pixels = np.broadcast_to(ramp[np.newaxis, :, :], (width, height, 3))
+    else:
+        pixels = np.broadcast_to(ramp[:, np.newaxis, :], (width, height, 3))
+    surface = pygame.Surface((width, height))
+    pygame.surfarray.blit_array(surface, np.ascontiguousarray(pixels))
+    return surface.convert()
 
 # Subtle gradient: top is a bit lighter; bottom slightly darker
 background_surface = create_gradient_surface(
@@ -83,29 +128,75 @@ def draw_grid(surface, grid_size=50):
     for y in range(0, HEIGHT, grid_size):
         pygame.draw.line(surface, LIGHT_GRAY, (0, y), (WIDTH, y), 1)
 
-# ----------------------
-# Inverse Kinematics
-# ----------------------
-def inverse_kinematics(x, y):
-    distance = math.sqrt(x**2 + y**2)
-    if distance > (L1 + L2):
-        return None
-    cos_angle2 = (x**2 + y**2 - L1**2 - L2**2) / (2 * L1 * L2)
-    cos_angle2 = max(-1, min(1, cos_angle2))
+# ----------------------------
+# Workspace Boundary (dashed)
+# ----------------------------
+def draw_workspace_boundary(surface, num_segs=60):
+    max_reach = L1 + L2
+    start_a = np.linspace(0, 2*np.pi, num_segs, endpoint=False)
+    end_a = start_a + math.pi / num_segs
+    angles = np.stack((start_a, end_a), axis=1)
+    dashes = np.stack(
+        (BASE_X + max_reach * np.cos(angles), BASE_Y + max_reach * np.sin(angles)),
+        axis=2
+    ).astype(np.int32)
+    for start_p, end_p in dashes:
+        pygame.draw.line(surface, LIGHT_GRAY, start_p, end_p, 1)
+
+# The gradient, grid and workspace boundary are all static, so bake them
+# into the background once instead of re-drawing ~94 lines every frame.
+draw_grid(background_surface)
+draw_workspace_boundary(background_surface)
+
+# ----------------------------------------
+# Arm Geometry (inverse + forward, scalar)
+# ----------------------------------------
+# Numba is optional: when present the geometry bundle below is JIT-compiled
+# to machine code, otherwise it runs as plain Python.
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+@njit(cache=True)
+def compute_arm_geometry(x, y):
+    """
+    Solve the inverse kinematics for target (x, y) in arm coordinates and
+    derive the joint/end screen positions in one pass.
+
+    Returns (reachable, theta1, theta2, k1, k2, joint_x, joint_y, end_x, end_y);
+    all values after the flag are zero when the target is out of reach.
+    """
+    # Reachability compares squared distances - no sqrt needed - and r2
+    # is reused in the elbow-angle cosine below.
+    r2 = x*x + y*y
+    if r2 > MAX_REACH_SQ:
+        return False, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0
+    cos_angle2 = (r2 - L1_SQ - L2_SQ) / TWO_L1_L2
+    cos_angle2 = max(-1.0, min(1.0, cos_angle2))
     theta2 = math.acos(cos_angle2)
 
     k1 = L1 + L2 * math.cos(theta2)
     k2 = L2 * math.sin(theta2)
     theta1 = math.atan2(y, x) - math.atan2(k2, k1)
-    return theta1, theta2, k1, k2
+
+    joint_x = BASE_X + L1 * math.cos(theta1)
+    joint_y = BASE_Y - L1 * math.sin(theta1)
+    end_x = joint_x + L2 * math.cos(theta1 + theta2)
+    end_y = joint_y - L2 * math.sin(theta1 + theta2)
+    return True, theta1, theta2, k1, k2, joint_x, joint_y, end_x, end_y
 
 # ---------------------------------------------
 # Anti-aliased drawing helpers (lines/circles)
 # ---------------------------------------------
 def draw_aa_circle(surface, center, radius, color):
+    # One C call instead of the gfxdraw aacircle + filled_circle pair;
+    # visually indistinguishable at the small radii used here.
     x, y = center
-    gfxdraw.aacircle(surface, int(x), int(y), radius, color)
-    gfxdraw.filled_circle(surface, int(x), int(y), radius, color)
+    pygame.draw.circle(surface, color, (int(x), int(y)), radius)
 
 def draw_aa_line(surface, start, end, color, width=1):
     pygame.draw.line(surface, color, start, end, width)
@@ -130,6 +221,11 @@ def draw_shadow(surface, center, radius, color=(0, 0, 0, 80)):
 # ---------------
 # Angle Arc
 # ---------------
+# Unit fractions for the 24-point arc fan; draw_angle_arc maps these onto
+# the requested angle span so the polygon points come out of one
+# vectorized cos/sin pair instead of 48 scalar trig calls per arc.
+ARC_FRACS = np.linspace(0.0, 1.0, 24)
+
 def draw_angle_arc(screen, center, start_angle, end_angle, radius, color, angle_text=None):
     """
     Draw an arc representing an angle, with a small label.
@@ -140,32 +236,31 @@ def draw_angle_arc(screen, center, start_angle, end_angle, radius, color, angle_
     arc_color = (*color[:3], 120)  # light alpha
     
     # Polygon for the filled arc
-    points = [arc_center]
-    for angle in np.linspace(-start_angle, -end_angle, 24):
-        points.append((
-            arc_center[0] + radius * math.cos(angle),
-            arc_center[1] + radius * math.sin(angle)
-        ))
-    if len(points) > 2:
-        pygame.draw.polygon(arc_surface, arc_color, points)
+    angles = -start_angle + ARC_FRACS * (start_angle - end_angle)
+    points = np.empty((len(ARC_FRACS) + 1, 2))
+    points[0] = arc_center
+    points[1:, 0] = arc_center[0] + radius * np.cos(angles)
+    points[1:, 1] = arc_center[1] + radius * np.sin(angles)
+    pygame.draw.polygon(arc_surface, arc_color, points)
     
     # Arc outline
     rect = pygame.Rect(0, 0, radius * 2, radius * 2)
     pygame.draw.arc(arc_surface, color, rect, -end_angle, -start_angle, 2)
-    screen.blit(arc_surface, (center[0] - arc_center[0], center[1] - arc_center[1]))
+    queue_blit(arc_surface, (center[0] - arc_center[0], center[1] - arc_center[1]))
     
     # Angle text
     if angle_text:
         mid_angle = (start_angle + end_angle) / 2
-        text = small_font.render(angle_text, True, color)
+        text = cached_render(small_font, angle_text, color)
         text_x = center[0] + (radius + 20) * math.cos(-mid_angle)
         text_y = center[1] + (radius + 20) * math.sin(-mid_angle)
         
         # Subtle text background
-        text_bg = pygame.Surface((text.get_width() + 8, text.get_height() + 4), pygame.SRCALPHA)
-        pygame.draw.rect(text_bg, (255, 255, 255, 200), text_bg.get_rect(), border_radius=4)
-        text_bg.blit(text, (4, 2))
-        screen.blit(text_bg, (text_x - text.get_width()/2 - 4, text_y - text.get_height()/2 - 2))
+        bg_x = text_x - text.get_width()/2 - 4
+        bg_y = text_y - text.get_height()/2 - 2
+        queue_blit(chrome_bg(text.get_width() + 8, text.get_height() + 4,
+                              (255, 255, 255, 200), border_radius=4), (bg_x, bg_y))
+        queue_blit(text, (bg_x + 4, bg_y + 2))
 
 # -------------------------
 # Length Indicator
@@ -188,31 +283,33 @@ def draw_length_indicator(screen, start_pos, end_pos, length, color):
     draw_aa_line(screen, start_pos, start_o, color, 1)
     draw_aa_line(screen, end_pos, end_o, color, 1)
     
-    text = font.render(f"{int(seg_len)}px", True, color)
+    text = cached_render(font, f"{int(seg_len)}px", color)
     text_x = (start_o[0] + end_o[0])/2 - text.get_width()/2
     text_y = (start_o[1] + end_o[1])/2 - text.get_height()/2
     
     # Subtle background for text
-    bg_rect = pygame.Surface((text.get_width() + 8, text.get_height() + 4), pygame.SRCALPHA)
-    pygame.draw.rect(bg_rect, (255, 255, 255, 220), bg_rect.get_rect(), border_radius=5)
-    pygame.draw.rect(bg_rect, color, bg_rect.get_rect(), width=1, border_radius=5)
-    bg_rect.blit(text, (4,2))
-    screen.blit(bg_rect, (text_x, text_y))
+    queue_blit(chrome_bg(text.get_width() + 8, text.get_height() + 4,
+                          (255, 255, 255, 220), color), (text_x, text_y))
+    queue_blit(text, (text_x + 4, text_y + 2))
 
 # --------------
 # Draw the Arm
 # --------------
-def draw_arm(theta1, theta2):
-    joint_x = BASE_X + L1 * math.cos(theta1)
-    joint_y = BASE_Y - L1 * math.sin(theta1)
-    end_x = joint_x + L2 * math.cos(theta1 + theta2)
-    end_y = joint_y - L2 * math.sin(theta1 + theta2)
+def draw_arm(theta1, theta2, joint_x, joint_y, end_x, end_y):
+    # Positions come pre-computed from compute_arm_geometry
+    deg1, deg2 = math.degrees(theta1), math.degrees(theta2)
 
     # Subtle shadows behind each joint
     draw_shadow(screen, (BASE_X, BASE_Y), 14, (0, 0, 0, 60))
     draw_shadow(screen, (int(joint_x), int(joint_y)), 14, (0, 0, 0, 60))
     draw_shadow(screen, (int(end_x), int(end_y)), 14, (0, 0, 0, 60))
     
+    # Everything from here to the end of the function draws on the screen
+    # without blitting to it (labels and arcs go through the deferred
+    # queue), so one lock/unlock pair replaces the implicit pair that
+    # every individual draw call would otherwise take.
+    screen.lock()
+
     # Draw segments
     draw_aa_line(screen, (BASE_X, BASE_Y), (joint_x, joint_y), BLUE, 6)
     draw_aa_line(screen, (joint_x, joint_y), (end_x, end_y), RED, 6)
@@ -228,8 +325,8 @@ def draw_arm(theta1, theta2):
     draw_aa_circle(screen, (int(end_x - 3), int(end_y - 3)), 3, (255, 255, 220))
 
     # Angle arcs
-    draw_angle_arc(screen, (BASE_X, BASE_Y), 0, theta1, 40, PURPLE, f"θ₁ = {math.degrees(theta1):.1f}°")
-    draw_angle_arc(screen, (int(joint_x), int(joint_y)), theta1, theta1 + theta2, 40, RED, f"θ₂ = {math.degrees(theta2):.1f}°")
+    draw_angle_arc(screen, (BASE_X, BASE_Y), 0, theta1, 40, PURPLE, f"θ₁ = {deg1:.1f}°")
+    draw_angle_arc(screen, (int(joint_x), int(joint_y)), theta1, theta1 + theta2, 40, RED, f"θ₂ = {deg2:.1f}°")
 
     # Labels (Base, Joint, End)
     labels = [
@@ -238,33 +335,34 @@ def draw_arm(theta1, theta2):
         (f"End ({int(end_x)}, {int(end_y)})", (int(end_x), int(end_y + 25)), ORANGE),
     ]
     for txt, pos, col in labels:
-        render = small_font.render(txt, True, col)
-        bg = pygame.Surface((render.get_width()+8, render.get_height()+4), pygame.SRCALPHA)
-        pygame.draw.rect(bg, (255, 255, 255, 220), bg.get_rect(), border_radius=5)
-        pygame.draw.rect(bg, col, bg.get_rect(), width=1, border_radius=5)
-        bg.blit(render, (4,2))
-        screen.blit(bg, (pos[0] - render.get_width()/2 - 4, pos[1] - render.get_height()/2 - 2))
+        render = cached_render(small_font, txt, col)
+        bg_x = pos[0] - render.get_width()/2 - 4
+        bg_y = pos[1] - render.get_height()/2 - 2
+        queue_blit(chrome_bg(render.get_width()+8, render.get_height()+4,
+                              (255, 255, 255, 220), col), (bg_x, bg_y))
+        queue_blit(render, (bg_x + 4, bg_y + 2))
     
     # Lengths
     draw_length_indicator(screen, (BASE_X, BASE_Y), (joint_x, joint_y), L1, BLUE)
     draw_length_indicator(screen, (joint_x, joint_y), (end_x, end_y), L2, RED)
 
-    # Subtle dashed line from base to end
+    # Subtle dashed line from base to end. All dash endpoints are computed
+    # in one NumPy broadcast instead of interpolating per dash in Python.
     total_length = math.sqrt((end_x - BASE_X)**2 + (end_y - BASE_Y)**2)
     dash_len = 5
     gap_len = 4
-    curr_dist = 0
-    while curr_dist < total_length:
-        start_t = curr_dist / total_length
-        end_t = min((curr_dist + dash_len) / total_length, 1.0)
-        sx = BASE_X + (end_x - BASE_X) * start_t
-        sy = BASE_Y + (end_y - BASE_Y) * start_t
-        ex = BASE_X + (end_x - BASE_X) * end_t
-        ey = BASE_Y + (end_y - BASE_Y) * end_t
-        draw_aa_line(screen, (sx, sy), (ex, ey), (100, 100, 100), 1)
-        curr_dist += dash_len + gap_len
-
-    return joint_x, joint_y, end_x, end_y
+    if total_length >= 1:
+        start_t = np.arange(0, total_length, dash_len + gap_len) / total_length
+        end_t = np.minimum(start_t + dash_len / total_length, 1.0)
+        ts = np.stack((start_t, end_t), axis=1)
+        dashes = np.stack(
+            (BASE_X + (end_x - BASE_X) * ts, BASE_Y + (end_y - BASE_Y) * ts),
+            axis=2
+        ).astype(np.int32)
+        for start_p, end_p in dashes:
+            pygame.draw.line(screen, (100, 100, 100), start_p, end_p, 1)
+
+    screen.unlock()
 
 # --------------
 # Rounded Rect
@@ -273,26 +371,17 @@ def create_rounded_rect_surface(width, height, color, radius=10):
     surface = pygame.Surface((width, height), pygame.SRCALPHA)
     rect = pygame.Rect(0, 0, width, height)
     pygame.draw.rect(surface, color, rect, border_radius=radius)
-    return surface
-
-# ------------
-# LaTeX Render
-# ------------
-def create_latex_surface(formula, color):
-    normalized_color = (color[0]/255, color[1]/255, color[2]/255)
-    fig, ax = plt.subplots(figsize=(6, 0.8), dpi=100, facecolor='white')
-    ax.text(0.5, 0.5, f"${formula}$", fontsize=18, ha='center', va='center', 
-            usetex=False, color=normalized_color, fontweight='bold')
-    ax.axis('off')
-    plt.tight_layout(pad=0.1)
-    buf = BytesIO()
-    plt.savefig(buf, format='png', dpi=100, bbox_inches='tight', pad_inches=0.1)
-    buf.seek(0)
-    plt.close(fig)
-
-    formula_image = pygame.image.load(buf, 'png')
-    buf.close()
-    return formula_image
+    return surface.convert_alpha()
+
+# ----------------
+# Formula Images
+# ----------------
+# Pre-rendered offline by tools/bake_formulas.py, so matplotlib is no
+# longer a runtime dependency. Re-run that script if a formula changes.
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+
+def load_formula_image(name):
+    return pygame.image.load(os.path.join(ASSETS_DIR, f"{name}.png")).convert_alpha()
 
 # ---------------
 # Info Panel
@@ -311,8 +400,8 @@ def draw_info_panel():
     pygame.draw.rect(screen, PANEL_OUTLINE, panel_rect, width=2, border_radius=10)
     
     # Title
-    title = header_font.render("Instructions", True, BLACK)
-    screen.blit(title, (panel_rect.x + 15, panel_rect.y + 10))
+    title = cached_render(header_font, "Instructions", BLACK)
+    queue_blit(title, (panel_rect.x + 15, panel_rect.y + 10))
     
     # Instructions
     instructions = [
@@ -321,18 +410,18 @@ def draw_info_panel():
         "• Arm is limited by segment lengths"
     ]
     for i, text in enumerate(instructions):
-        t_surf = small_font.render(text, True, BLACK)
-        screen.blit(t_surf, (panel_rect.x + 15, panel_rect.y + 50 + i*22))
+        t_surf = cached_render(small_font, text, BLACK)
+        queue_blit(t_surf, (panel_rect.x + 15, panel_rect.y + 50 + i*22))
 
 # -----------------------------
 # Pre-rendered LaTeX Surfaces
 # -----------------------------
 latex_surfaces = {
-    "title": header_font.render("Inverse Kinematics Formulas", True, BLACK),
-    "theta2": create_latex_surface("\\theta_2 = \\cos^{-1}\\left(\\frac{x^2 + y^2 - L_1^2 - L_2^2}{2 L_1 L_2}\\right)", RED),
-    "k1": create_latex_surface("k_1 = L_1 + L_2 \\cdot \\cos(\\theta_2)", GREEN),
-    "k2": create_latex_surface("k_2 = L_2 \\cdot \\sin(\\theta_2)", BLUE),
-    "theta1": create_latex_surface("\\theta_1 = \\tan^{-1}\\left(\\frac{y}{x}\\right) - \\tan^{-1}\\left(\\frac{k_2}{k_1}\\right)", PURPLE),
+    "title": header_font.render("Inverse Kinematics Formulas", True, BLACK).convert_alpha(),
+    "theta2": load_formula_image("theta2"),
+    "k1": load_formula_image("k1"),
+    "k2": load_formula_image("k2"),
+    "theta1": load_formula_image("theta1"),
 }
 
 # Background for each formula
@@ -347,6 +436,61 @@ for key in ["theta2", "k1", "k2", "theta1"]:
     )
     formula_panels[key] = bg_surf
 
+# -----------------------------------
+# Formulas Panel (static backdrop)
+# -----------------------------------
+# The panel geometry never changes, so pre-composite the shadow, gradient
+# background, outline, header bar and divider into one surface at startup
+# instead of rebuilding the 330x330 gradient every frame.
+panel_width = 330
+panel_height = 330
+panel_x = WIDTH - panel_width - 20
+panel_y = 110
+shadow_offset = 4
+header_h = 48
+
+formulas_panel_static = pygame.Surface(
+    (panel_width + shadow_offset, panel_height + shadow_offset), pygame.SRCALPHA
+)
+pygame.draw.rect(formulas_panel_static, SHADOW_ALPHA,
+                 (shadow_offset, shadow_offset, panel_width, panel_height),
+                 border_radius=12)
+formulas_panel_static.blit(
+    create_gradient_surface(panel_width, panel_height, (250, 250, 255), (230, 230, 245), True),
+    (0, 0)
+)
+pygame.draw.rect(formulas_panel_static, PANEL_OUTLINE,
+                 (0, 0, panel_width, panel_height), 2, border_radius=12)
+_header_surf = pygame.Surface((panel_width, header_h), pygame.SRCALPHA)
+pygame.draw.rect(_header_surf, (210, 210, 230, 80), _header_surf.get_rect(), border_radius=12)
+formulas_panel_static.blit(_header_surf, (0, 0))
+pygame.draw.line(formulas_panel_static, PANEL_OUTLINE,
+                 (10, header_h), (panel_width - 10, header_h), 1)
+
+# The title, formula backgrounds and formula images never move either, so
+# composite them into the same static surface. Only the four numeric value
+# boxes below each formula remain dynamic per frame.
+FORMULA_OFFSETS = {"theta2": 60, "k1": 125, "k2": 190, "theta1": 255}
+
+formulas_panel_static.blit(
+    latex_surfaces["title"],
+    (panel_width//2 - latex_surfaces["title"].get_width()//2, 8)
+)
+FORMULA_VALUE_Y = {}
+for key, y_off in FORMULA_OFFSETS.items():
+    f_surf = latex_surfaces[key]
+    bg_surf = formula_panels[key]
+    bg_x = panel_width//2 - bg_surf.get_width()//2
+    formulas_panel_static.blit(bg_surf, (bg_x, y_off))
+    formulas_panel_static.blit(f_surf, (
+        bg_x + (bg_surf.get_width() - f_surf.get_width())//2,
+        y_off + (bg_surf.get_height() - f_surf.get_height())//2
+    ))
+    FORMULA_VALUE_Y[key] = panel_y + y_off + bg_surf.get_height() + 4
+
+# Match the display pixel format once the panel is fully composited
+formulas_panel_static = formulas_panel_static.convert_alpha()
+
 # ---------------------------------
 # Main Loop Initialization
 # ---------------------------------
@@ -357,6 +501,30 @@ MAX_PATH_LENGTH = 60
 trail_points = []
 MAX_TRAIL_LENGTH = 20
 
+# The trail only ever uses MAX_TRAIL_LENGTH distinct (radius, opacity)
+# combinations, so pre-render one circle surface per slot instead of
+# allocating and rasterizing a fresh SRCALPHA surface per point per frame.
+TRAIL_RADII = []
+TRAIL_SURFS = []
+for i in range(MAX_TRAIL_LENGTH):
+    opacity = int((i / MAX_TRAIL_LENGTH) * 180)
+    radius = int(2 + (i / MAX_TRAIL_LENGTH) * 6)
+    surf = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA)
+    pygame.draw.circle(surf, (ORANGE[0], ORANGE[1], ORANGE[2], opacity), (radius, radius), radius)
+    TRAIL_RADII.append(radius)
+    TRAIL_SURFS.append(surf.convert_alpha())
+
+def blend_over_background(color, opacity):
+    """Pre-blend an RGBA color against the constant background color."""
+    return tuple(
+        BACKGROUND[j] + (color[j] - BACKGROUND[j]) * opacity // 255
+        for j in range(3)
+    )
+
+# Every fade level the end-effector path can use, pre-blended once. The
+# per-segment opacity is int(i/len * 200), so 0..200 covers all cases.
+PATH_COLORS = [blend_over_background((100, 100, 200), opacity) for opacity in range(201)]
+
 # ----------------
 # Main Game Loop
 # ----------------
@@ -365,10 +533,9 @@ while running:
         if event.type == pygame.QUIT:
             running = False
 
-    # Background & grid
+    # Background (gradient + grid + workspace boundary pre-baked)
     screen.blit(background_surface, (0, 0))
-    draw_grid(screen)
-    
+
     # Info panel
     draw_info_panel()
 
@@ -378,136 +545,86 @@ while running:
     trail_points.append((mouse_x, mouse_y))
     if len(trail_points) > MAX_TRAIL_LENGTH:
         trail_points.pop(0)
-    for i, point in enumerate(trail_points):
-        opacity = int((i / MAX_TRAIL_LENGTH) * 180)
-        trail_color = (ORANGE[0], ORANGE[1], ORANGE[2], opacity)
-        radius = int(2 + (i / MAX_TRAIL_LENGTH) * 6)
-        trail_surface = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA)
-        pygame.draw.circle(trail_surface, trail_color, (radius, radius), radius)
-        screen.blit(trail_surface, (point[0] - radius, point[1] - radius))
+    # Skip trail circles that lie fully outside the window (common right
+    # after the cursor leaves it) - a doomed blit still pays full SDL
+    # setup cost even though nothing is drawn.
+    screen.fblits([
+        (TRAIL_SURFS[i], (point[0] - TRAIL_RADII[i], point[1] - TRAIL_RADII[i]))
+        for i, point in enumerate(trail_points)
+        if -TRAIL_RADII[i] < point[0] < WIDTH + TRAIL_RADII[i]
+        and -TRAIL_RADII[i] < point[1] < HEIGHT + TRAIL_RADII[i]
+    ])
 
     # Target in arm coords
     target_x = mouse_x - BASE_X
     target_y = BASE_Y - mouse_y
-    angles = inverse_kinematics(target_x, target_y)
+    reachable, theta1, theta2, k1, k2, joint_x, joint_y, end_x, end_y = \
+        compute_arm_geometry(target_x, target_y)
 
-    if angles:
-        theta1, theta2, k1, k2 = angles
-        joint_x, joint_y, end_x, end_y = draw_arm(theta1, theta2)
+    if reachable:
+        draw_arm(theta1, theta2, joint_x, joint_y, end_x, end_y)
         mouse_path.append((end_x, end_y))
         if len(mouse_path) > MAX_PATH_LENGTH:
             mouse_path.pop(0)
         
-        # Faded path from the end effector
+        # Faded path from the end effector. The alpha fade is approximated
+        # by pre-blending the path color against the constant background,
+        # so the segments can be drawn straight onto the screen instead of
+        # through a full-screen SRCALPHA surface per segment.
         if len(mouse_path) > 1:
-            for i in range(1, len(mouse_path)):
-                opacity = int((i / len(mouse_path)) * 200)
-                path_color = (100, 100, 200, opacity)
+            screen.lock()
+            path_len = len(mouse_path)
+            for i in range(1, path_len):
                 start_p = mouse_path[i-1]
                 end_p = mouse_path[i]
-                seg_surf = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-                pygame.draw.line(seg_surf, path_color, start_p, end_p, 2)
-                screen.blit(seg_surf, (0, 0))
+                # Reject segments whose bounding box misses the window
+                if (max(start_p[0], end_p[0]) < 0 or min(start_p[0], end_p[0]) >= WIDTH
+                        or max(start_p[1], end_p[1]) < 0 or min(start_p[1], end_p[1]) >= HEIGHT):
+                    continue
+                path_color = PATH_COLORS[int((i / path_len) * 200)]
+                pygame.draw.aaline(screen, path_color, start_p, end_p)
+            screen.unlock()
     else:
-        theta1, theta2, k1, k2 = None, None, None, None
         # Out of reach notice
-        out_text = font.render("Target out of reach!", True, RED)
-        text_bg = pygame.Surface((out_text.get_width()+20, out_text.get_height()+10), pygame.SRCALPHA)
-        pygame.draw.rect(text_bg, (255, 200, 200, 220), text_bg.get_rect(), border_radius=8)
-        text_bg.blit(out_text, (10,5))
-        screen.blit(text_bg, (mouse_x - out_text.get_width()//2 - 10, mouse_y - 50))
+        out_text = cached_render(font, "Target out of reach!", RED)
+        bg_x = mouse_x - out_text.get_width()//2 - 10
+        bg_y = mouse_y - 50
+        queue_blit(chrome_bg(out_text.get_width()+20, out_text.get_height()+10,
+                              (255, 200, 200, 220), border_radius=8), (bg_x, bg_y))
+        queue_blit(out_text, (bg_x + 10, bg_y + 5))
 
     # Target effect
     t_radius = 6 + math.sin(pygame.time.get_ticks()/250)*2
     draw_shadow(screen, (mouse_x, mouse_y), int(t_radius)+2)
+    screen.lock()
     draw_aa_circle(screen, (mouse_x, mouse_y), int(t_radius), ORANGE)
-    
+
     # Crosshair
     crosshair = 6
     pygame.draw.line(screen, BLACK, (mouse_x - crosshair, mouse_y), (mouse_x + crosshair, mouse_y), 1)
     pygame.draw.line(screen, BLACK, (mouse_x, mouse_y - crosshair), (mouse_x, mouse_y + crosshair), 1)
+    screen.unlock()
 
     # Title text
-    title = title_font.render("2D Robotic Arm Simulator", True, DARK_BLUE)
-    screen.blit(title, (WIDTH // 2 - title.get_width() // 2, 15))
-    
-    # Formulas panel
-    panel_width = 330
-    panel_height = 330
-    panel_x = WIDTH - panel_width - 20
-    panel_y = 110
-    
-    # Panel shadow
-    shadow_offset = 4
-    pygame.draw.rect(screen, SHADOW_ALPHA, 
-                     (panel_x+shadow_offset, panel_y+shadow_offset, panel_width, panel_height), 
-                     border_radius=12)
-    # Panel background
-    panel_bg = create_gradient_surface(panel_width, panel_height, (250, 250, 255), (230, 230, 245), True)
-    screen.blit(panel_bg, (panel_x, panel_y))
-    pygame.draw.rect(screen, PANEL_OUTLINE, (panel_x, panel_y, panel_width, panel_height), 2, border_radius=12)
-
-    # Panel header
-    header_h = 48
-    pygame.draw.rect(screen, (210, 210, 230, 80), (panel_x, panel_y, panel_width, header_h), border_radius=12)
-    pygame.draw.line(screen, PANEL_OUTLINE, 
-                     (panel_x+10, panel_y+header_h), 
-                     (panel_x+panel_width-10, panel_y+header_h), 1)
-    screen.blit(latex_surfaces["title"], 
-        (panel_x + panel_width//2 - latex_surfaces["title"].get_width()//2, panel_y + 8)
-    )
+    title = cached_render(title_font, "2D Robotic Arm Simulator", DARK_BLUE)
+    queue_blit(title, (WIDTH // 2 - title.get_width() // 2, 15))
     
-    # Position formulas
-    offsets = {
-        "theta2": panel_y + 60,
-        "k1": panel_y + 125,
-        "k2": panel_y + 190,
-        "theta1": panel_y + 255
-    }
-    for key, y_pos in offsets.items():
-        f_surf = latex_surfaces[key]
-        bg_surf = formula_panels[key]
-        
-        bg_x = panel_x + panel_width//2 - bg_surf.get_width()//2
-        screen.blit(bg_surf, (bg_x, y_pos))
-        
-        # Formula
-        fx = bg_x + (bg_surf.get_width() - f_surf.get_width())//2
-        fy = y_pos + (bg_surf.get_height() - f_surf.get_height())//2
-        screen.blit(f_surf, (fx, fy))
-        
-        # Numeric values
-        if angles:
-            val_text = None
-            if key == "theta2" and theta2 is not None:
-                val_text = font.render(f"θ₂ = {math.degrees(theta2):.2f}°", True, RED)
-            elif key == "k1" and k1 is not None:
-                val_text = font.render(f"k₁ = {k1:.2f}", True, GREEN)
-            elif key == "k2" and k2 is not None:
-                val_text = font.render(f"k₂ = {k2:.2f}", True, BLUE)
-            elif key == "theta1" and theta1 is not None:
-                val_text = font.render(f"θ₁ = {math.degrees(theta1):.2f}°", True, PURPLE)
-            
-            if val_text:
-                val_bg = pygame.Surface((val_text.get_width()+10, val_text.get_height()+6), pygame.SRCALPHA)
-                pygame.draw.rect(val_bg, (255, 255, 255, 220), val_bg.get_rect(), border_radius=5)
-                pygame.draw.rect(val_bg, (150, 150, 150), val_bg.get_rect(), 1, border_radius=5)
-                val_bg.blit(val_text, (5, 3))
-                vx = bg_x + bg_surf.get_width()//2 - val_text.get_width()//2 - 5
-                vy = y_pos + bg_surf.get_height() + 4
-                screen.blit(val_bg, (vx, vy))
-
-    # Workspace boundary (dashed circle)
-    max_reach = L1 + L2
-    num_segs = 60
-    for i in range(num_segs):
-        start_a = i * 2*math.pi / num_segs
-        end_a = (i + 0.5) * 2*math.pi / num_segs
-        sx = BASE_X + max_reach * math.cos(start_a)
-        sy = BASE_Y + max_reach * math.sin(start_a)
-        ex = BASE_X + max_reach * math.cos(end_a)
-        ey = BASE_Y + max_reach * math.sin(end_a)
-        pygame.draw.line(screen, LIGHT_GRAY, (sx, sy), (ex, ey), 1)
+    # Formulas panel (fully pre-composited; only the values are dynamic)
+    queue_blit(formulas_panel_static, (panel_x, panel_y))
+
+    if reachable:
+        value_texts = {
+            "theta2": cached_render(font, f"θ₂ = {math.degrees(theta2):.2f}°", RED),
+            "k1": cached_render(font, f"k₁ = {k1:.2f}", GREEN),
+            "k2": cached_render(font, f"k₂ = {k2:.2f}", BLUE),
+            "theta1": cached_render(font, f"θ₁ = {math.degrees(theta1):.2f}°", PURPLE),
+        }
+        for key, val_text in value_texts.items():
+            vx = panel_x + panel_width//2 - val_text.get_width()//2 - 5
+            vy = FORMULA_VALUE_Y[key]
+            queue_blit(chrome_bg(val_text.get_width()+10, val_text.get_height()+6,
+                                 (255, 255, 255, 220), (150, 150, 150)), (vx, vy))
+            queue_blit(val_text, (vx + 5, vy + 3))
 
     # Status Panel
     status_x = 10
@@ -515,16 +632,19 @@ while running:
     status_width = 280
     status_height = 30
 
-    st_bg = pygame.Surface((status_width, status_height), pygame.SRCALPHA)
-    pygame.draw.rect(st_bg, (255, 255, 255, 210), st_bg.get_rect(), border_radius=6)
-    pygame.draw.rect(st_bg, (150, 150, 180), st_bg.get_rect(), 1, border_radius=6)
-    st_text_color = GREEN if angles else RED
-    if angles:
-        st_txt = small_font.render(f"Target: ({target_x:.1f}, {target_y:.1f}) - In Reach", True, st_text_color)
+    queue_blit(chrome_bg(status_width, status_height,
+                          (255, 255, 255, 210), (150, 150, 180), border_radius=6),
+                (status_x, status_y))
+    st_text_color = GREEN if reachable else RED
+    if reachable:
+        st_txt = cached_render(small_font, f"Target: ({target_x:.1f}, {target_y:.1f}) - In Reach", st_text_color)
     else:
-        st_txt = small_font.render(f"Target: ({target_x:.1f}, {target_y:.1f}) - Out of Reach", True, st_text_color)
-    st_bg.blit(st_txt, (10, 5))
-    screen.blit(st_bg, (status_x, status_y))
+        st_txt = cached_render(small_font, f"Target: ({target_x:.1f}, {target_y:.1f}) - Out of Reach", st_text_color)
+    queue_blit(st_txt, (status_x + 10, status_y + 5))
+
+    # Flush the deferred UI layer in one batched call
+    screen.fblits(draw_queue)
+    draw_queue.clear()
 
     pygame.display.flip()
     clock.tick(60)
@@ -0,0 +1,55 @@
+"""
+Render the inverse-kinematics formula images to PNG assets.
+
+The simulator used to rasterize these with matplotlib at every startup,
+which cost seconds of import time and ~50 MB of memory for four static
+images. Run this script once (from the repo root) whenever a formula or
+its color changes:
+
+    python tools/bake_formulas.py
+
+The PNGs land in assets/ and are loaded directly by arm.py.
+"""
+import os
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+# Keep in sync with the color palette in arm.py
+RED = (220, 60, 60)
+BLUE = (60, 120, 216)
+GREEN = (60, 179, 113)
+PURPLE = (138, 43, 226)
+
+FORMULAS = {
+    "theta2": ("\\theta_2 = \\cos^{-1}\\left(\\frac{x^2 + y^2 - L_1^2 - L_2^2}{2 L_1 L_2}\\right)", RED),
+    "k1": ("k_1 = L_1 + L_2 \\cdot \\cos(\\theta_2)", GREEN),
+    "k2": ("k_2 = L_2 \\cdot \\sin(\\theta_2)", BLUE),
+    "theta1": ("\\theta_1 = \\tan^{-1}\\left(\\frac{y}{x}\\right) - \\tan^{-1}\\left(\\frac{k_2}{k_1}\\right)", PURPLE),
+}
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "assets")
+
+
+def bake_formula(path, formula, color):
+    normalized_color = (color[0]/255, color[1]/255, color[2]/255)
+    fig, ax = plt.subplots(figsize=(6, 0.8), dpi=100, facecolor='white')
+    ax.text(0.5, 0.5, f"${formula}$", fontsize=18, ha='center', va='center',
+            usetex=False, color=normalized_color, fontweight='bold')
+    ax.axis('off')
+    plt.tight_layout(pad=0.1)
+    plt.savefig(path, format='png', dpi=100, bbox_inches='tight', pad_inches=0.1)
+    plt.close(fig)
+
+
+def main():
+    os.makedirs(ASSETS_DIR, exist_ok=True)
+    for name, (formula, color) in FORMULAS.items():
+        path = os.path.join(ASSETS_DIR, f"{name}.png")
+        bake_formula(path, formula, color)
+        print(f"baked {path}")
+
+
+if __name__ == "__main__":
+    main()